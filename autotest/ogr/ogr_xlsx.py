@@ -11,8 +11,7 @@
 # SPDX-License-Identifier: MIT
 ###############################################################################
 
-import os
-import shutil
+import datetime
 
 import gdaltest
 import pytest
@@ -21,6 +20,115 @@ from osgeo import gdal, ogr
 
 pytestmark = pytest.mark.require_driver("XLSX")
 
+# None if the driver is not available, in which case all tests are skipped
+_XLSX_DRV = ogr.GetDriverByName("XLSX")
+
+
+@pytest.fixture()
+def ogrsf_path():
+    import test_cli_utilities
+
+    path = test_cli_utilities.get_test_ogrsf_path()
+    if path is None:
+        pytest.skip("ogrsf test utility not found")
+
+    return path
+
+
+@pytest.fixture()
+def ogr2ogr_path():
+    import test_cli_utilities
+
+    path = test_cli_utilities.get_ogr2ogr_path()
+    if path is None:
+        pytest.skip("ogr2ogr utility not found")
+
+    return path
+
+
+###############################################################################
+# Load data/xlsx/test.xlsx once in /vsimem/, so that the tests of this module
+# that open it in-process do not read it from disk again
+
+_CACHED_TEST_XLSX = "/vsimem/ogr_xlsx_cached_test.xlsx"
+
+
+@pytest.fixture(scope="module", autouse=True)
+def cache_test_xlsx():
+
+    with open("data/xlsx/test.xlsx", "rb") as f:
+        gdal.FileFromMemBuffer(_CACHED_TEST_XLSX, f.read())
+    yield
+    gdal.Unlink(_CACHED_TEST_XLSX)
+
+
+###############################################################################
+# Translate data/poly.shp to XLSX once, and return the content of the file
+
+
+_POLY_XLSX_LAYER = "first"
+
+
+@pytest.fixture(scope="module")
+def poly_xlsx_bytes(tmp_path_factory):
+
+    filename = tmp_path_factory.mktemp("xlsx") / "poly.xlsx"
+    gdal.VectorTranslate(
+        str(filename), "data/poly.shp", format="XLSX", layerName=_POLY_XLSX_LAYER
+    )
+    return filename.read_bytes()
+
+
+###############################################################################
+# Return the field types of a layer as a tuple
+
+
+def _field_types(lyr):
+
+    defn = lyr.GetLayerDefn()
+    return tuple(defn.GetFieldDefn(i).GetType() for i in range(defn.GetFieldCount()))
+
+
+# Field types of the Feuille7 layer of data/xlsx/test.xlsx
+_FEUILLE7_FIELD_TYPES = (
+    ogr.OFTString,
+    ogr.OFTInteger,
+    ogr.OFTReal,
+    ogr.OFTReal,
+    ogr.OFTDate,
+    ogr.OFTDateTime,
+    ogr.OFTReal,
+    ogr.OFTTime,
+    ogr.OFTReal,
+    ogr.OFTInteger,
+    ogr.OFTReal,
+    ogr.OFTDateTime,
+)
+
+# Field types of data/xlsx/test_missing_row1_data.xlsx and
+# data/xlsx/test_empty_last_field.xlsx
+_ASSET_SHEET_FIELD_TYPES = (
+    ogr.OFTInteger,
+    ogr.OFTString,
+    ogr.OFTString,
+    ogr.OFTInteger,
+    ogr.OFTString,
+    ogr.OFTDate,
+    ogr.OFTString,
+    ogr.OFTString,
+    ogr.OFTString,
+    ogr.OFTString,
+    ogr.OFTString,
+    ogr.OFTDate,
+    ogr.OFTString,
+    ogr.OFTString,
+    ogr.OFTString,
+    ogr.OFTString,
+    ogr.OFTString,
+    ogr.OFTString,
+)
+
+
 ###############################################################################
 # Check
 
@@ -33,7 +141,7 @@ def ogr_xlsx_check(ds):
 
     lyr = ds.GetLayer(0)
     assert lyr.GetName() == "Feuille1", "bad layer name"
-    assert lyr.GetDataset().GetDescription() == ds.GetDescription()
+    assert lyr.GetDataset().this == ds.this
 
     assert lyr.GetGeomType() == ogr.wkbNone, "bad layer geometry type"
 
@@ -50,40 +158,20 @@ def ogr_xlsx_check(ds):
 
     assert lyr.GetLayerDefn().GetFieldCount() == 12
 
-    type_array = [
-        ogr.OFTString,
-        ogr.OFTInteger,
-        ogr.OFTReal,
-        ogr.OFTReal,
-        ogr.OFTDate,
-        ogr.OFTDateTime,
-        ogr.OFTReal,
-        ogr.OFTTime,
-        ogr.OFTReal,
-        ogr.OFTInteger,
-        ogr.OFTReal,
-        ogr.OFTDateTime,
-    ]
-
-    for i, typ in enumerate(type_array):
-        assert lyr.GetLayerDefn().GetFieldDefn(i).GetType() == typ
+    assert _field_types(lyr) == _FEUILLE7_FIELD_TYPES
 
     feat = lyr.GetNextFeature()
-    if (
-        feat.GetFieldAsString(0) != "val"
-        or feat.GetFieldAsInteger(1) != 23
-        or feat.GetFieldAsDouble(2) != 3.45
-        or feat.GetFieldAsDouble(3) != 0.52
-        or feat.GetFieldAsString(4) != "2012/01/22"
-        or feat.GetFieldAsString(5) != "2012/01/22 18:49:00"
-    ):
-        feat.DumpReadable()
-        pytest.fail()
+    assert [
+        feat.GetFieldAsString(0),
+        feat.GetFieldAsInteger(1),
+        feat.GetFieldAsDouble(2),
+        feat.GetFieldAsDouble(3),
+        feat.GetFieldAsString(4),
+        feat.GetFieldAsString(5),
+    ] == ["val", 23, 3.45, 0.52, "2012/01/22", "2012/01/22 18:49:00"]
 
     feat = lyr.GetNextFeature()
-    if feat.IsFieldSet(2):
-        feat.DumpReadable()
-        pytest.fail()
+    assert not feat.IsFieldSet(2), "field 2 of second feature should be unset"
 
 
 ###############################################################################
@@ -92,26 +180,32 @@ def ogr_xlsx_check(ds):
 
 def test_ogr_xlsx_1():
 
-    assert ogr.GetDriverByName("XLSX").TestCapability("foo") == 0
+    assert _XLSX_DRV.TestCapability("foo") == 0
 
-    ds = ogr.Open("data/xlsx/test.xlsx")
+    ds = ogr.Open(_CACHED_TEST_XLSX)
     assert ds is not None, "cannot open dataset"
 
-    return ogr_xlsx_check(ds)
+    ogr_xlsx_check(ds)
 
 
 ###############################################################################
 # Test OGR_XLSX_HEADERS = DISABLE
 
 
-def test_ogr_xlsx_2():
+@pytest.fixture()
+def headers_disable():
 
     with gdal.config_option("OGR_XLSX_HEADERS", "DISABLE"):
-        ds = ogr.Open("data/xlsx/test.xlsx")
+        yield
+
 
-        lyr = ds.GetLayerByName("Feuille7")
+def test_ogr_xlsx_2(headers_disable):
 
-        assert lyr.GetFeatureCount() == 3
+    ds = ogr.Open(_CACHED_TEST_XLSX)
+
+    lyr = ds.GetLayerByName("Feuille7")
+
+    assert lyr.GetFeatureCount() == 3
 
 
 ###############################################################################
@@ -120,7 +214,7 @@ def test_ogr_xlsx_2():
 
 def test_ogr_xlsx_headers_open_option():
 
-    ds = gdal.OpenEx("data/xlsx/test.xlsx", open_options=["HEADERS=DISABLE"])
+    ds = gdal.OpenEx(_CACHED_TEST_XLSX, open_options=["HEADERS=DISABLE"])
 
     lyr = ds.GetLayerByName("Feuille7")
 
@@ -131,14 +225,20 @@ def test_ogr_xlsx_headers_open_option():
 # Test OGR_XLSX_FIELD_TYPES = STRING
 
 
-def test_ogr_xlsx_3():
+@pytest.fixture()
+def field_types_string():
 
     with gdal.config_option("OGR_XLSX_FIELD_TYPES", "STRING"):
-        ds = ogr.Open("data/xlsx/test.xlsx")
+        yield
+
+
+def test_ogr_xlsx_3(field_types_string):
+
+    ds = ogr.Open(_CACHED_TEST_XLSX)
 
-        lyr = ds.GetLayerByName("Feuille7")
+    lyr = ds.GetLayerByName("Feuille7")
 
-        assert lyr.GetLayerDefn().GetFieldDefn(1).GetType() == ogr.OFTString
+    assert lyr.GetLayerDefn().GetFieldDefn(1).GetType() == ogr.OFTString
 
 
 ###############################################################################
@@ -147,7 +247,7 @@ def test_ogr_xlsx_3():
 
 def test_ogr_xlsx_field_types_open_option():
 
-    ds = gdal.OpenEx("data/xlsx/test.xlsx", open_options=["FIELD_TYPES=STRING"])
+    ds = gdal.OpenEx(_CACHED_TEST_XLSX, open_options=["FIELD_TYPES=STRING"])
 
     lyr = ds.GetLayerByName("Feuille7")
 
@@ -158,16 +258,9 @@ def test_ogr_xlsx_field_types_open_option():
 # Run test_ogrsf
 
 
-def test_ogr_xlsx_4():
-
-    import test_cli_utilities
+def test_ogr_xlsx_4(ogrsf_path):
 
-    if test_cli_utilities.get_test_ogrsf_path() is None:
-        pytest.skip()
-
-    ret = gdaltest.runexternal(
-        test_cli_utilities.get_test_ogrsf_path() + " -ro data/xlsx/test.xlsx"
-    )
+    ret = gdaltest.runexternal(ogrsf_path + " -ro data/xlsx/test.xlsx")
 
     assert ret.find("INFO") != -1 and ret.find("ERROR") == -1
 
@@ -176,19 +269,12 @@ def test_ogr_xlsx_4():
 # Run test_ogrsf
 
 
-def test_ogr_xlsx_test_ogrsf_update(tmp_path):
-
-    import test_cli_utilities
-
-    if test_cli_utilities.get_test_ogrsf_path() is None:
-        pytest.skip()
+def test_ogr_xlsx_test_ogrsf_update(ogrsf_path, poly_xlsx_bytes, tmp_path):
 
-    filename = str(tmp_path / "out.xlsx")
-    gdal.VectorTranslate(filename, "data/poly.shp", format="XLSX")
+    filename = tmp_path / "out.xlsx"
+    filename.write_bytes(poly_xlsx_bytes)
 
-    ret = gdaltest.runexternal(
-        test_cli_utilities.get_test_ogrsf_path() + f" {filename}"
-    )
+    ret = gdaltest.runexternal(ogrsf_path + f" {filename}")
 
     assert "INFO" in ret
     assert "ERROR" not in ret
@@ -198,24 +284,15 @@ def test_ogr_xlsx_test_ogrsf_update(tmp_path):
 # Test write support
 
 
-def test_ogr_xlsx_5():
+def test_ogr_xlsx_5(ogr2ogr_path, tmp_path):
 
-    import test_cli_utilities
-
-    if test_cli_utilities.get_ogr2ogr_path() is None:
-        pytest.skip()
-
-    gdaltest.runexternal(
-        test_cli_utilities.get_ogr2ogr_path()
-        + " -f XLSX tmp/test.xlsx data/xlsx/test.xlsx"
-    )
+    filename = str(tmp_path / "test.xlsx")
+    gdaltest.runexternal(ogr2ogr_path + f" -f XLSX {filename} data/xlsx/test.xlsx")
 
-    ds = ogr.Open("tmp/test.xlsx")
+    ds = ogr.Open(filename)
     ogr_xlsx_check(ds)
     ds = None
 
-    os.unlink("tmp/test.xlsx")
-
 
 ###############################################################################
 # Test reading a file using inlineStr representation.
@@ -244,38 +321,29 @@ def test_ogr_xlsx_6():
 # Test update support
 
 
-def test_ogr_xlsx_7():
+def test_ogr_xlsx_7(tmp_vsimem):
 
-    if os.path.exists("tmp/ogr_xlsx_7.xlsx"):
-        gdal.Unlink("tmp/ogr_xlsx_7.xlsx")
-    shutil.copy("data/xlsx/test.xlsx", "tmp/ogr_xlsx_7.xlsx")
+    filename = str(tmp_vsimem / "ogr_xlsx_7.xlsx")
+    assert gdal.CopyFile(_CACHED_TEST_XLSX, filename) == 0
 
-    ds = gdal.OpenEx("tmp/ogr_xlsx_7.xlsx", gdal.OF_VECTOR | gdal.OF_UPDATE)
+    ds = gdal.OpenEx(filename, gdal.OF_VECTOR | gdal.OF_UPDATE)
     lyr = ds.GetLayerByName("Feuille7")
     feat = lyr.GetNextFeature()
-    if feat.GetFID() != 2:
-        feat.DumpReadable()
-        pytest.fail("did not get expected FID")
+    assert feat.GetFID() == 2, "did not get expected FID"
     feat.SetField(0, "modified_value")
     lyr.SetFeature(feat)
     feat = None
     assert ds.FlushCache() == gdal.CE_None
     ds = None
 
-    ds = ogr.Open("tmp/ogr_xlsx_7.xlsx")
+    ds = ogr.Open(filename)
     lyr = ds.GetLayerByName("Feuille7")
     feat = lyr.GetNextFeature()
-    if feat.GetFID() != 2:
-        feat.DumpReadable()
-        pytest.fail("did not get expected FID")
-    if feat.GetField(0) != "modified_value":
-        feat.DumpReadable()
-        pytest.fail("did not get expected value")
+    assert feat.GetFID() == 2, "did not get expected FID"
+    assert feat.GetField(0) == "modified_value", "did not get expected value"
     feat = None
     ds = None
 
-    os.unlink("tmp/ogr_xlsx_7.xlsx")
-
 
 ###############################################################################
 # Test number of columns > 26 (#5774)
@@ -283,24 +351,28 @@ def test_ogr_xlsx_7():
 
 def test_ogr_xlsx_8():
 
-    ds = ogr.GetDriverByName("XLSX").CreateDataSource("/vsimem/ogr_xlsx_8.xlsx")
+    ds = _XLSX_DRV.CreateDataSource("/vsimem/ogr_xlsx_8.xlsx")
     lyr = ds.CreateLayer("foo")
-    assert lyr.GetDataset().GetDescription() == ds.GetDescription()
+    assert lyr.GetDataset().this == ds.this
     assert lyr.TestCapability(ogr.OLCStringsAsUTF8) == 1
+    # CreateField() copies the field definition, so a single one can be reused
+    fld_defn = ogr.FieldDefn("Field1")
     for i in range(30):
-        lyr.CreateField(ogr.FieldDefn("Field%d" % (i + 1)))
+        fld_defn.SetName(f"Field{i + 1}")
+        lyr.CreateField(fld_defn)
     f = ogr.Feature(lyr.GetLayerDefn())
     for i in range(30):
-        f.SetField(i, "val%d" % (i + 1))
+        f.SetField(i, f"val{i + 1}")
     lyr.CreateFeature(f)
     f = None
     ds = None
 
-    f = gdal.VSIFOpenL("/vsizip//vsimem/ogr_xlsx_8.xlsx/xl/worksheets/sheet1.xml", "rb")
-    content = gdal.VSIFReadL(1, 10000, f)
+    filename = "/vsizip//vsimem/ogr_xlsx_8.xlsx/xl/worksheets/sheet1.xml"
+    f = gdal.VSIFOpenL(filename, "rb")
+    content = gdal.VSIFReadL(1, gdal.VSIStatL(filename).size, f)
     gdal.VSIFCloseL(f)
 
-    assert str(content).find('<c r="AA1" t="s">') >= 0
+    assert b'<c r="AA1" t="s">' in content
 
     gdal.Unlink("/vsimem/ogr_xlsx_8.xlsx")
 
@@ -311,7 +383,7 @@ def test_ogr_xlsx_8():
 
 def test_ogr_xlsx_9():
 
-    ds = ogr.GetDriverByName("XLSX").CreateDataSource("/vsimem/ogr_xlsx_9.xlsx")
+    ds = _XLSX_DRV.CreateDataSource("/vsimem/ogr_xlsx_9.xlsx")
     lyr = ds.CreateLayer("foo")
     lyr.CreateField(ogr.FieldDefn("Field1", ogr.OFTInteger64))
     f = ogr.Feature(lyr.GetLayerDefn())
@@ -329,7 +401,7 @@ def test_ogr_xlsx_9():
     ds = ogr.Open("/vsimem/ogr_xlsx_9.xlsx")
     lyr = ds.GetLayer(0)
     assert lyr.GetLayerDefn().GetFieldDefn(0).GetType() == ogr.OFTInteger64
-    f = lyr.GetNextFeature()
+    assert lyr.SetNextByIndex(1) == ogr.OGRERR_NONE
     f = lyr.GetNextFeature()
     assert f.GetField(0) == 12345678901234
     ds = None
@@ -340,39 +412,49 @@ def test_ogr_xlsx_9():
 ###############################################################################
 # Test DateTime with milliseconds
 
+# (written value, expected read value), one DateTime field per case
+_DATETIME_MS_CASES = (
+    ("2015/12/23 12:34:56.789", "2015/12/23 12:34:56.789"),
+    ("2015/12/23 12:34:56.000", "2015/12/23 12:34:56"),
+    ("2015/12/23 12:34:56", "2015/12/23 12:34:56"),
+)
+
 
-def test_ogr_xlsx_10():
+@pytest.fixture(scope="module")
+def datetime_ms_ds():
 
-    ds = ogr.GetDriverByName("XLSX").CreateDataSource("/vsimem/ogr_xlsx_10.xlsx")
+    filename = "/vsimem/ogr_xlsx_datetime_ms.xlsx"
+    ds = _XLSX_DRV.CreateDataSource(filename)
     lyr = ds.CreateLayer("foo")
-    lyr.CreateField(ogr.FieldDefn("Field1", ogr.OFTDateTime))
-    lyr.CreateField(ogr.FieldDefn("Field2", ogr.OFTDateTime))
-    lyr.CreateField(ogr.FieldDefn("Field3", ogr.OFTDateTime))
+    for i in range(len(_DATETIME_MS_CASES)):
+        lyr.CreateField(ogr.FieldDefn(f"Field{i + 1}", ogr.OFTDateTime))
+    # The feature can only be created once all fields are defined
     f = ogr.Feature(lyr.GetLayerDefn())
-    f.SetField(0, "2015/12/23 12:34:56.789")
-    f.SetField(1, "2015/12/23 12:34:56.000")
-    f.SetField(2, "2015/12/23 12:34:56")
+    for i, (inp, _) in enumerate(_DATETIME_MS_CASES):
+        f.SetField(i, inp)
     lyr.CreateFeature(f)
     f = None
     ds = None
 
-    ds = ogr.Open("/vsimem/ogr_xlsx_10.xlsx")
-    lyr = ds.GetLayer(0)
-    for i in range(3):
-        assert lyr.GetLayerDefn().GetFieldDefn(i).GetType() == ogr.OFTDateTime
-    f = lyr.GetNextFeature()
-    if f.GetField(0) != "2015/12/23 12:34:56.789":
-        f.DumpReadable()
-        pytest.fail()
-    if f.GetField(1) != "2015/12/23 12:34:56":
-        f.DumpReadable()
-        pytest.fail()
-    if f.GetField(2) != "2015/12/23 12:34:56":
-        f.DumpReadable()
-        pytest.fail()
-    ds = None
+    with ogr.Open(filename) as ds:
+        yield ds
 
-    gdal.Unlink("/vsimem/ogr_xlsx_10.xlsx")
+    gdal.Unlink(filename)
+
+
+@pytest.mark.parametrize(
+    "i,expected",
+    [(i, expected) for i, (_, expected) in enumerate(_DATETIME_MS_CASES)],
+    # use the time part of the written value as test id
+    ids=[inp.split(" ")[1] for inp, _ in _DATETIME_MS_CASES],
+)
+def test_ogr_xlsx_datetime_ms(datetime_ms_ds, i, expected):
+
+    lyr = datetime_ms_ds.GetLayer(0)
+    assert lyr.GetLayerDefn().GetFieldDefn(i).GetType() == ogr.OFTDateTime
+    lyr.ResetReading()
+    f = lyr.GetNextFeature()
+    assert f.GetField(i) == expected
 
 
 ###############################################################################
@@ -385,9 +467,7 @@ def test_ogr_xlsx_11():
     lyr = ds.GetLayer(0)
     f = lyr.GetNextFeature()
     for i in (0, 27, 28, 29):
-        if f["Field%d" % (i + 1)] != "val%d" % (i + 1):
-            f.DumpReadable()
-            pytest.fail()
+        assert f["Field%d" % (i + 1)] == "val%d" % (i + 1)
     ds = None
 
 
@@ -406,109 +486,43 @@ def test_ogr_xlsx_12():
 
 
 ###############################################################################
-# Test that data types are correctly picked up even if first row is missing data
-
-
-def test_ogr_xlsx_13():
-
-    ds = ogr.Open("data/xlsx/test_missing_row1_data.xlsx")
-
-    lyr = ds.GetLayer(0)
-    assert lyr.GetName() == "Sheet1", "bad layer name"
-
-    assert (
-        lyr.GetLayerDefn().GetFieldDefn(0).GetName() == "Asset Reference"
-    ), "invalid field name"
-
-    assert lyr.GetLayerDefn().GetFieldCount() == 18, "invalid field count ({})".format(
-        lyr.GetLayerDefn().GetFieldCount()
-    )
-
-    type_array = [
-        ogr.OFTInteger,
-        ogr.OFTString,
-        ogr.OFTString,
-        ogr.OFTInteger,
-        ogr.OFTString,
-        ogr.OFTDate,
-        ogr.OFTString,
-        ogr.OFTString,
-        ogr.OFTString,
-        ogr.OFTString,
-        ogr.OFTString,
-        ogr.OFTDate,
-        ogr.OFTString,
-        ogr.OFTString,
-        ogr.OFTString,
-        ogr.OFTString,
-        ogr.OFTString,
-        ogr.OFTString,
-    ]
-
-    for i, typ in enumerate(type_array):
-        assert (
-            lyr.GetLayerDefn().GetFieldDefn(i).GetType() == typ
-        ), "invalid type for field {}".format(i + 1)
-
-
-###############################################################################
-# Test that field names are picked up even if last field has no data
+# Test that data types are correctly picked up even if first row is missing
+# data, and that field names are picked up even if last field has no data
 
 
-def test_ogr_xlsx_14():
+@pytest.mark.parametrize(
+    "path",
+    ["data/xlsx/test_missing_row1_data.xlsx", "data/xlsx/test_empty_last_field.xlsx"],
+)
+def test_ogr_xlsx_field_types(path):
 
-    ds = ogr.Open("data/xlsx/test_empty_last_field.xlsx")
+    ds = ogr.Open(path)
 
     lyr = ds.GetLayer(0)
     assert lyr.GetName() == "Sheet1", "bad layer name"
 
-    assert (
-        lyr.GetLayerDefn().GetFieldDefn(0).GetName() == "Asset Reference"
-    ), "invalid field name"
+    defn = lyr.GetLayerDefn()
+    assert defn.GetFieldDefn(0).GetName() == "Asset Reference", "invalid field name"
 
-    assert lyr.GetLayerDefn().GetFieldCount() == 18, "invalid field count ({})".format(
-        lyr.GetLayerDefn().GetFieldCount()
+    assert defn.GetFieldCount() == 18, "invalid field count ({})".format(
+        defn.GetFieldCount()
     )
 
-    type_array = [
-        ogr.OFTInteger,
-        ogr.OFTString,
-        ogr.OFTString,
-        ogr.OFTInteger,
-        ogr.OFTString,
-        ogr.OFTDate,
-        ogr.OFTString,
-        ogr.OFTString,
-        ogr.OFTString,
-        ogr.OFTString,
-        ogr.OFTString,
-        ogr.OFTDate,
-        ogr.OFTString,
-        ogr.OFTString,
-        ogr.OFTString,
-        ogr.OFTString,
-        ogr.OFTString,
-        ogr.OFTString,
-    ]
-
-    for i, typ in enumerate(type_array):
-        assert (
-            lyr.GetLayerDefn().GetFieldDefn(i).GetType() == typ
-        ), "invalid type for field {}".format(i + 1)
+    assert _field_types(lyr) == _ASSET_SHEET_FIELD_TYPES, "invalid field types"
 
 
 ###############################################################################
 # Test appending a layer to an existing document
 
 
-def test_ogr_xlsx_15():
+def test_ogr_xlsx_15(poly_xlsx_bytes):
 
     out_filename = "/vsimem/ogr_xlsx_15.xlsx"
-    gdal.VectorTranslate(out_filename, "data/poly.shp", options="-f XLSX -nln first")
+    gdal.FileFromMemBuffer(out_filename, poly_xlsx_bytes)
     gdal.VectorTranslate(out_filename, "data/poly.shp", options="-update -nln second")
 
     ds = ogr.Open(out_filename)
-    assert ds.GetLayerByName("first").GetFeatureCount() != 0
+    assert ds.GetLayerByName(_POLY_XLSX_LAYER).GetFeatureCount() != 0
     assert ds.GetLayerByName("second").GetFeatureCount() != 0
     ds = None
 
@@ -522,7 +536,7 @@ def test_ogr_xlsx_15():
 def test_ogr_xlsx_boolean():
 
     out_filename = "/vsimem/ogr_xlsx_boolean.xlsx"
-    ds = ogr.GetDriverByName("XLSX").CreateDataSource(out_filename)
+    ds = _XLSX_DRV.CreateDataSource(out_filename)
     lyr = ds.CreateLayer("foo")
     fld_defn = ogr.FieldDefn("Field1", ogr.OFTInteger)
     fld_defn.SetSubType(ogr.OFSTBoolean)
@@ -548,22 +562,45 @@ def test_ogr_xlsx_boolean():
 # Test reading DateTime, and numeric precision issues (#2683)
 
 
+_DATETIME_XLSX_VALUES = [
+    "2020/04/07 09:58:00",
+    "2020/04/07 09:58:01",
+    "2020/04/07 09:58:02",
+    "2020/04/07 09:58:03",
+    "2020/04/07 09:58:04",
+    "2020/04/07 09:58:05",
+    "2020/04/07 10:03:00",
+    "2020/04/07 10:10:00",
+    "2020/04/07 10:29:00",
+    "2020/04/07 10:42:00",
+]
+
+
 def test_ogr_xlsx_read_datetime():
 
     ds = ogr.Open("data/xlsx/datetime.xlsx")
     lyr = ds.GetLayer(0)
     got = [f.GetFieldAsString(0) for f in lyr]
+    assert got == _DATETIME_XLSX_VALUES
+
+
+###############################################################################
+# Same as above, but reading the whole column through the ArrowStream API
+
+
+def test_ogr_xlsx_read_datetime_arrow_stream():
+
+    pytest.importorskip("pyarrow")
+
+    ds = ogr.Open("data/xlsx/datetime.xlsx")
+    lyr = ds.GetLayer(0)
+    got = []
+    for batch in lyr.GetArrowStreamAsPyArrow(["INCLUDE_FID=NO"]):
+        got += batch.column(0).to_pylist()
+    # Compare datetime objects, so that any sub-second residue is caught
     assert got == [
-        "2020/04/07 09:58:00",
-        "2020/04/07 09:58:01",
-        "2020/04/07 09:58:02",
-        "2020/04/07 09:58:03",
-        "2020/04/07 09:58:04",
-        "2020/04/07 09:58:05",
-        "2020/04/07 10:03:00",
-        "2020/04/07 10:10:00",
-        "2020/04/07 10:29:00",
-        "2020/04/07 10:42:00",
+        datetime.datetime.strptime(x, "%Y/%m/%d %H:%M:%S")
+        for x in _DATETIME_XLSX_VALUES
     ]
 
 
@@ -575,20 +612,45 @@ def test_ogr_xlsx_read_cells_with_inline_formatting():
 
     ds = ogr.Open("data/xlsx/cells_with_inline_formatting.xlsx")
     lyr = ds.GetLayer(0)
-    got = [(f[0], f[1], f[2]) for f in lyr]
+    got = [(f.GetField(0), f.GetField(1), f.GetField(2)) for f in lyr]
     assert got == [(1, "text 2", "text 3"), (2, "text 4", "text5")]
 
 
+###############################################################################
+# Same as above, but reading the whole columns through the ArrowStream API
+
+
+def test_ogr_xlsx_read_cells_with_inline_formatting_arrow_stream():
+
+    pytest.importorskip("pyarrow")
+
+    ds = ogr.Open("data/xlsx/cells_with_inline_formatting.xlsx")
+    lyr = ds.GetLayer(0)
+    got = []
+    for batch in lyr.GetArrowStreamAsPyArrow(["INCLUDE_FID=NO"]):
+        got += zip(*[batch.column(i).to_pylist() for i in range(3)])
+    assert got == [(1, "text 2", "text 3"), (2, "text 4", "text5")]
+
+
+###############################################################################
+# Content of data/xlsx/cells_with_inline_formatting.xlsx, read once
+
+
+@pytest.fixture(scope="module")
+def inline_formatting_bytes():
+
+    with open("data/xlsx/cells_with_inline_formatting.xlsx", "rb") as f:
+        return f.read()
+
+
 ###############################################################################
 # Test reading a XLSX file without a XLSX extension
 
 
-def test_ogr_xlsx_read_no_xlsx_extension():
+def test_ogr_xlsx_read_no_xlsx_extension(inline_formatting_bytes):
 
     tmpfilename = "/vsimem/temp"
-    with gdaltest.tempfile(
-        tmpfilename, open("data/xlsx/cells_with_inline_formatting.xlsx", "rb").read()
-    ):
+    with gdaltest.tempfile(tmpfilename, inline_formatting_bytes):
         assert ogr.Open(tmpfilename) is not None
 
 
@@ -596,12 +658,10 @@ def test_ogr_xlsx_read_no_xlsx_extension():
 # Test reading a XLSX file with XLSX: prefix
 
 
-def test_ogr_xlsx_read_xlsx_prefix():
+def test_ogr_xlsx_read_xlsx_prefix(inline_formatting_bytes):
 
     tmpfilename = "/vsimem/temp"
-    with gdaltest.tempfile(
-        tmpfilename, open("data/xlsx/cells_with_inline_formatting.xlsx", "rb").read()
-    ):
+    with gdaltest.tempfile(tmpfilename, inline_formatting_bytes):
         assert ogr.Open("XLSX:" + tmpfilename) is not None
 
 
@@ -612,7 +672,7 @@ def test_ogr_xlsx_read_xlsx_prefix():
 def test_ogr_xlsx_write_sheet_without_row():
 
     tmpfilename = "/vsimem/temp.xlsx"
-    ds = ogr.GetDriverByName("XLSX").CreateDataSource(tmpfilename)
+    ds = _XLSX_DRV.CreateDataSource(tmpfilename)
     lyr = ds.CreateLayer("L1")
     lyr.CreateField(ogr.FieldDefn("foo"))
     lyr = ds.CreateLayer("L2")